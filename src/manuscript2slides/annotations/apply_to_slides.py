@@ -86,7 +86,7 @@ def add_comments_to_speaker_notes(
             # Sort comments by date (newest first, or change reverse=False for oldest first)
             sorted_comments = sorted(
                 comments_list,
-                key=lambda c: getattr(c.comment_obj, "timestamp", None) or datetime.min,
+                key=lambda c: c.comment_obj.timestamp or datetime.min,
                 reverse=False,
             )
         else:
@@ -97,35 +97,29 @@ def add_comments_to_speaker_notes(
         comment_run.text = "COMMENTS FROM SOURCE DOCUMENT:\n" + "=" * 40
 
         for i, comment in enumerate(sorted_comments, 1):
-            # Check if comment has paragraphs attribute
-            if hasattr(comment.comment_obj, "paragraphs"):
-                # Get paragraphs safely, default to empty list if not present
-                this_comment_paragraphs = getattr(comment.comment_obj, "paragraphs", [])
-                for para in this_comment_paragraphs:
-                    if hasattr(para, "text") and para.text.rstrip():
-                        notes_para = notes_text_frame.add_paragraph()
-                        comment_header = notes_para.add_run()
-
-                        if cfg.comments_keep_author_and_date:
-                            author = getattr(
-                                comment.comment_obj, "author", "Unknown Author"
-                            )
-                            timestamp = getattr(comment.comment_obj, "timestamp", None)
-
-                            if timestamp and hasattr(timestamp, "strftime"):
-                                timestamp_str = timestamp.strftime(
-                                    "%A, %B %d, %Y at %I:%M %p"
-                                )
-                            else:
-                                timestamp_str = "Unknown Date"
-
-                            comment_header.text = (
-                                f"\n {i}. {author} ({timestamp_str}):\n"
-                            )
-
-                        else:
-                            comment_header.text = "\n"
-                        process_docx_paragraph_inner_contents(para, notes_para, cfg)
+            # comment_obj is always a python-docx Comment, so read its attributes directly
+            # rather than probing for them with hasattr()/getattr() on every iteration.
+            comment_obj = comment.comment_obj
+
+            # The header line only depends on the comment, so build it once rather than for each of its paragraphs
+            if cfg.comments_keep_author_and_date:
+                author = comment_obj.author or "Unknown Author"
+                timestamp = comment_obj.timestamp
+
+                if timestamp is not None:
+                    timestamp_str = timestamp.strftime("%A, %B %d, %Y at %I:%M %p")
+                else:
+                    timestamp_str = "Unknown Date"
+
+                header_text = f"\n {i}. {author} ({timestamp_str}):\n"
+            else:
+                header_text = "\n"
+
+            for para in comment_obj.paragraphs:
+                if para.text.rstrip():
+                    notes_para = notes_text_frame.add_paragraph()
+                    notes_para.add_run().text = header_text
+                    process_docx_paragraph_inner_contents(para, notes_para, cfg)
 
 
 # endregion
@@ -155,16 +149,17 @@ def add_notes_to_speaker_notes(
             notes_para = notes_text_frame.add_paragraph()
             note_run = notes_para.add_run()
 
-            # Start with the main note text
-            note_text = f"\n{note_obj.note_id}. {note_obj.text_body}\n"
+            # Start with the main note text, collecting the pieces to join once at the end
+            note_text_parts = [f"\n{note_obj.note_id}. {note_obj.text_body}\n"]
 
             # Add hyperlinks if they exist
             if note_obj.hyperlinks:
-                note_text += "\nHyperlinks:"
-                for hyperlink in note_obj.hyperlinks:
-                    note_text += f"\n{hyperlink}"
+                note_text_parts.append("\nHyperlinks:")
+                note_text_parts.extend(
+                    f"\n{hyperlink}" for hyperlink in note_obj.hyperlinks
+                )
 
-            note_run.text = note_text
+            note_run.text = "".join(note_text_parts)
 
 
 # endregion
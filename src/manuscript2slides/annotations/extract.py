@@ -3,10 +3,11 @@
 import logging
 import re
 import xml.etree.ElementTree as ET
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 from docx import document
 from docx.comments import Comment as Comment_docx
+from docx.oxml.ns import qn
 from docx.text.paragraph import Paragraph as Paragraph_docx
 from docx.text.run import Run as Run_docx
 
@@ -22,12 +23,24 @@ from manuscript2slides.processing import docx_xml
 log = logging.getLogger("manuscript2slides")
 NOTE_TYPE = TypeVar("NOTE_TYPE", Footnote_docx, Endnote_docx)
 
+# Clark-notation ("{namespace-uri}localname") tags and attributes, built once at import so that XML lookups
+# don't need a namespace map or a freshly formatted attribute name on every call.
+_W_COMMENT_REF = qn("w:commentReference")
+_W_FOOTNOTE_REF = qn("w:footnoteReference")
+_W_ENDNOTE_REF = qn("w:endnoteReference")
+ANNOTATION_REF_TAGS = (_W_COMMENT_REF, _W_FOOTNOTE_REF, _W_ENDNOTE_REF)
+_W_ID = qn("w:id")
+_W_FOOTNOTE = qn("w:footnote")
+_W_ENDNOTE = qn("w:endnote")
+_W_R = qn("w:r")
+_W_HYPERLINK = qn("w:hyperlink")
+
 
 # region extract_notes_from_xml
 def extract_notes_from_xml(
-    root: ET.Element, note_class: type[NOTE_TYPE]
+    notes: Iterable[ET.Element], note_class: type[NOTE_TYPE]
 ) -> dict[str, NOTE_TYPE]:
-    """Extract footnotes or endnotes from XML, depending on note_class provided."""
+    """Extract footnotes or endnotes from their XML elements, depending on note_class provided."""
 
     # Construct the strings we need to use in the XML search.
     # First, define the prefix and the namespace to which it will refer.
@@ -44,7 +57,7 @@ def extract_notes_from_xml(
 
     notes_dict: dict[str, NOTE_TYPE] = {}
 
-    for note in root:
+    for note in notes:
         note_id = note.get(id_attribute)
         note_type = note.get(type_attribute)
 
@@ -100,34 +113,45 @@ def process_chunk_annotations(
     all_footnotes = get_all_docx_footnotes(doc, cfg)
     all_endnotes = get_all_docx_endnotes(doc, cfg)
 
-    for chunk in chunks:
-        for paragraph in chunk.paragraphs:
-            for item in paragraph.iter_inner_content():
-                if isinstance(item, Run_docx):
-                    process_run_annotations(
-                        chunk,
-                        paragraph,
-                        item,
-                        all_raw_comments=all_raw_comments,
-                        all_footnotes=all_footnotes,
-                        all_endnotes=all_endnotes,
-                    )
-
-                # If the item has the attribute "url" we assume it is of type Hyperlink instead of Run;
-                # that means it contains its own child runs, so we need to go one step inward to process them.
-                elif hasattr(item, "url"):
-                    # Process all runs within the hyperlink
-                    for run in item.runs:
-                        process_run_annotations(
-                            chunk,
-                            paragraph,
-                            run,
-                            all_raw_comments=all_raw_comments,
-                            all_footnotes=all_footnotes,
-                            all_endnotes=all_endnotes,
-                        )
-                else:
-                    log.warning(f"Unknown content type in paragraph: {type(item)}")
+    # Map each chunked paragraph's XML element back to its chunk, so that one walk over the document body
+    # can hand every annotation reference straight to the chunk it belongs to. Most runs carry no references,
+    # so this avoids visiting (and re-parsing) every run of every paragraph just to find the few that do.
+    chunk_lookup = {
+        paragraph._p: (chunk, paragraph)
+        for chunk in chunks
+        for paragraph in chunk.paragraphs
+    }
+
+    last_run_element = None
+    for ref in doc.element.body.iter(*ANNOTATION_REF_TAGS):
+        # Find the run holding this reference. Runs are direct children of a paragraph, or are nested
+        # one level down inside a hyperlink.
+        for run_element in ref.iterancestors(_W_R):
+            parent = run_element.getparent()
+            if parent is not None and parent.tag == _W_HYPERLINK:
+                parent = parent.getparent()
+            match = chunk_lookup.get(parent)
+            if match is not None:
+                break
+        else:
+            # Not inside any chunked paragraph (e.g., a table cell), so there's no chunk to attach it to
+            continue
+
+        # process_run_annotations() handles every reference in a run at once, and references from the same
+        # run are adjacent in document order, so only process each run the first time we reach it.
+        if run_element is last_run_element:
+            continue
+        last_run_element = run_element
+
+        chunk, paragraph = match
+        process_run_annotations(
+            chunk,
+            paragraph,
+            Run_docx(run_element, paragraph),
+            all_raw_comments=all_raw_comments,
+            all_footnotes=all_footnotes,
+            all_endnotes=all_endnotes,
+        )
 
     return chunks
 
@@ -145,51 +169,52 @@ def process_run_annotations(
     all_endnotes: dict[str, Endnote_docx],
 ) -> None:
     """Get the annotations from a run object and adding them into its (grand)parent chunk object."""
-    try:
-        # Get XML from the run using public API
-        run_xml = run.element.xml
-
-        # Parse it safely with ElementTree
-        root = ET.fromstring(run_xml)
-
-        # Define namespace
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-
-        # get the reference text to be used by comments, footnotes, or endnotes
-        ref_text = get_ref_text(run, paragraph)
-
-        # Find comment references
-        comment_refs = root.findall(".//w:commentReference", ns)
-        for ref in comment_refs:
-            comment_id = ref.get(f"{{{ns['w']}}}id")
-            if comment_id and comment_id in all_raw_comments:
-                comment_object = all_raw_comments[comment_id]
-
-                custom_comment_obj = Comment_docx_custom(
-                    comment_obj=comment_object, reference_text=ref_text
-                )
-                chunk.add_comment(custom_comment_obj)
-
-        # Find footnote references
-        footnote_refs = root.findall(".//w:footnoteReference", ns)
-        for ref in footnote_refs:
-            footnote_id = ref.get(f"{{{ns['w']}}}id")
-            if footnote_id and footnote_id in all_footnotes:
-                footnote_obj = all_footnotes[footnote_id]
-                footnote_obj.reference_text = ref_text
-                chunk.add_footnote(footnote_obj)
-
-        # Find endnote references - same pattern
-        endnote_refs = root.findall(".//w:endnoteReference", ns)
-        for ref in endnote_refs:
-            endnote_id = ref.get(f"{{{ns['w']}}}id")
-            if endnote_id and endnote_id in all_endnotes:
-                endnote_obj = all_endnotes[endnote_id]
-                endnote_obj.reference_text = ref_text
-                chunk.add_endnote(endnote_obj)
-
-    except (AttributeError, ET.ParseError) as e:
-        log.warning(f"Could not parse run XML for references: {e}")
+    # run.element is already the live lxml element python-docx parsed the document into, so search it directly
+    # rather than serializing it to a string and re-parsing that with ElementTree.
+    root = run.element
+
+    # Find comment, footnote, and endnote references in a single walk over the run, dispatching on each one's tag.
+    # Each kind goes to its own list on the chunk, so the order within each kind is the same as three separate walks.
+    comments: list[Comment_docx] = []
+    footnotes: list[Footnote_docx] = []
+    endnotes: list[Endnote_docx] = []
+    for ref in root.iter(*ANNOTATION_REF_TAGS):
+        ref_id = ref.get(_W_ID)
+        if not ref_id:
+            continue
+        tag = ref.tag
+
+        if tag == _W_COMMENT_REF:
+            if ref_id in all_raw_comments:
+                comments.append(all_raw_comments[ref_id])
+        elif tag == _W_FOOTNOTE_REF:
+            if ref_id in all_footnotes:
+                footnotes.append(all_footnotes[ref_id])
+        # Endnotes - same pattern
+        elif ref_id in all_endnotes:
+            endnotes.append(all_endnotes[ref_id])
+
+    # References to annotations we aren't collecting (e.g. footnotes when display_footnotes is off) don't need any
+    # reference text, so only work it out once we know something will use it.
+    if not (comments or footnotes or endnotes):
+        return
+
+    # get the reference text to be used by comments, footnotes, or endnotes
+    ref_text = get_ref_text(run, paragraph)
+
+    for comment_object in comments:
+        custom_comment_obj = Comment_docx_custom(
+            comment_obj=comment_object, reference_text=ref_text
+        )
+        chunk.add_comment(custom_comment_obj)
+
+    for footnote_obj in footnotes:
+        footnote_obj.reference_text = ref_text
+        chunk.add_footnote(footnote_obj)
+
+    for endnote_obj in endnotes:
+        endnote_obj.reference_text = ref_text
+        chunk.add_endnote(endnote_obj)
 
 
 # endregion
@@ -201,11 +226,15 @@ def get_ref_text(run: Run_docx, paragraph: Paragraph_docx) -> str | None:
     Get the Run or Paragraph text with which a piece of metadata is associated in the docx so that we can store that in
     metadata and reference it on reverse-pipeline runs.
     """
-    if run.text and run.text.strip():
-        ref_text = run.text
-    elif paragraph.text and paragraph.text.strip():
+    # .text rebuilds the string from the XML on every access, so read each one at most once
+    run_text = run.text
+    if run_text and run_text.strip():
+        return run_text
+
+    paragraph_text = paragraph.text
+    if paragraph_text and paragraph_text.strip():
         # Grab the first (up to 10) words of this paragraph if the run text is empty
-        ref_text = " ".join(paragraph.text.split()[:10])
+        ref_text = " ".join(paragraph_text.split()[:10])
     else:
         ref_text = None
 
@@ -226,12 +255,13 @@ def get_all_docx_comments(doc: document.Document) -> dict[str, Comment_docx]:
         "3": "<docx.comments.Comment object at 0x00000###>
     }
     """
-    all_comments_dict: dict[str, Comment_docx] = {}
+    # Document.comments only exists in python-docx 1.2+, and each access goes back through the document part,
+    # so look it up once.
+    comments = getattr(doc, "comments", None)
+    if not comments:
+        return {}
 
-    if hasattr(doc, "comments") and doc.comments:
-        for comment in doc.comments:
-            all_comments_dict[str(comment.comment_id)] = comment
-    return all_comments_dict
+    return {str(comment.comment_id): comment for comment in comments}
 
 
 # endregion
@@ -255,9 +285,10 @@ def get_all_docx_footnotes(
         if not footnotes_parts:
             return {}
 
-        # We think this will always be a list of one item, so assign that item to a variable.
-        root = docx_xml.parse_xml_blob(footnotes_parts[0].blob)
-        return extract_notes_from_xml(root, Footnote_docx)
+        # We think this will always be a list of one item, so use that item.
+        # Stream the footnotes out of the part one at a time rather than building its whole tree up front.
+        notes = docx_xml.iterparse_xml_blob(footnotes_parts[0].blob, _W_FOOTNOTE)
+        return extract_notes_from_xml(notes, Footnote_docx)
 
     except Exception as e:
         log.warning(f"Could not extract footnotes: {e}")
@@ -284,8 +315,8 @@ def get_all_docx_endnotes(
         if not endnotes_parts:
             return {}
 
-        root = docx_xml.parse_xml_blob(endnotes_parts[0].blob)
-        return extract_notes_from_xml(root, Endnote_docx)
+        notes = docx_xml.iterparse_xml_blob(endnotes_parts[0].blob, _W_ENDNOTE)
+        return extract_notes_from_xml(notes, Endnote_docx)
 
     except Exception as e:
         log.warning(f"Could not extract endnotes: {e}")
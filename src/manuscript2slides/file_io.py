@@ -4,9 +4,9 @@
 # mypy: disable-error-code="import-untyped"
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 import docx
 import pptx
@@ -18,19 +18,24 @@ from pptx.slide import Slide
 from manuscript2slides.internals import constants
 from manuscript2slides.internals.define_config import UserConfig
 from manuscript2slides.internals.run_context import get_pipeline_run_id
-from manuscript2slides.processing.populate_docx import get_slide_paragraphs
+from manuscript2slides.processing.populate_docx import iter_slide_paragraphs
+from manuscript2slides.utils import preview_text
 
 log = logging.getLogger("manuscript2slides")
 
 OUTPUT_TYPE = TypeVar("OUTPUT_TYPE", document.Document, presentation.Presentation)
 
+# Write buffer for saving output files (1 MiB)
+_SAVE_BUFFER_SIZE = 1 << 20
+
 # region validate path/extension helpers (Read I/O)
 
 
 # region _validate_path
 def _validate_path(user_path: str | Path) -> Path:
     """Ensure filepath exists and is a file."""
-    path = Path(user_path)
+    # Callers often already hold a Path, so don't re-wrap it
+    path = user_path if isinstance(user_path, Path) else Path(user_path)
     pipeline_id = get_pipeline_run_id()
     if not path.exists():
         # Check if this looks like a Windows path on a non-Windows system
@@ -65,17 +70,18 @@ def validate_docx_path(user_path: str | Path) -> Path:
     pipeline_id = get_pipeline_run_id()
 
     # Verify it's the right extension:
-    if path.suffix.lower() == ".doc":
+    suffix = path.suffix.lower()
+    if suffix == ".docx":
+        return path
+    if suffix == ".doc":
         log.error(f"Unsupported .doc file: {path} [pipeline:{pipeline_id}]")
         raise ValueError(
             "This tool only supports .docx files. Please convert your .doc file to .docx format first."
         )
-    if path.suffix.lower() != ".docx":
-        log.error(
-            f"Wrong file extension: expected .docx, got {path.suffix} [pipeline:{pipeline_id}]"
-        )
-        raise ValueError(f"Expected a .docx file, but got: {path.suffix}")
-    return path
+    log.error(
+        f"Wrong file extension: expected .docx, got {path.suffix} [pipeline:{pipeline_id}]"
+    )
+    raise ValueError(f"Expected a .docx file, but got: {path.suffix}")
 
 
 # endregion
@@ -90,17 +96,18 @@ def validate_pptx_path(user_path: str | Path) -> Path:
     pipeline_id = get_pipeline_run_id()
 
     # Verify it's the right extension:
-    if path.suffix.lower() == ".ppt":
+    suffix = path.suffix.lower()
+    if suffix == ".pptx":
+        return path
+    if suffix == ".ppt":
         log.error(f"Unsupported .ppt file: {path} [pipeline:{pipeline_id}]")
         raise ValueError(
             "This tool only supports .pptx files. Please convert your .ppt file to .pptx format first."
         )
-    if path.suffix.lower() != ".pptx":
-        log.error(
-            f"Wrong file extension: expected .pptx, got {path.suffix} [pipeline:{pipeline_id}]"
-        )
-        raise ValueError(f"Expected a .pptx file, but got: {path.suffix}")
-    return path
+    log.error(
+        f"Wrong file extension: expected .pptx, got {path.suffix} [pipeline:{pipeline_id}]"
+    )
+    raise ValueError(f"Expected a .pptx file, but got: {path.suffix}")
 
 
 # endregion
@@ -138,14 +145,17 @@ def load_and_validate_docx(input_filepath: Path) -> document.Document:
         )
         raise ValueError(f"Document may be corrupted or in wrong format:\n{e}")
 
+    # doc.paragraphs builds a new list of Paragraph objects on every access, so get it once
+    paragraphs = doc.paragraphs
+
     # Validate it contains content
-    if not doc.paragraphs:
+    if not paragraphs:
         log.error(
             f"Document {str(input_filepath)} contains no paragraphs [pipeline:{pipeline_id}]"
         )
         raise ValueError("Document contains no paragraphs.")
 
-    first_para_w_text = _find_first_docx_paragraph_with_text(doc.paragraphs)
+    first_para_w_text = _find_first_docx_paragraph_with_text(paragraphs)
     if first_para_w_text is None:
         log.error(
             f"Document {str(input_filepath)} contains no text content [pipeline:{pipeline_id}]"
@@ -155,13 +165,12 @@ def load_and_validate_docx(input_filepath: Path) -> document.Document:
         )
 
     # Report content information to the user
-    paragraph_count = len(doc.paragraphs)
+    paragraph_count = len(paragraphs)
     log.info(
         f"This document has {paragraph_count} paragraphs in it. [pipeline:{pipeline_id}]"
     )
 
-    text = first_para_w_text.text
-    preview = text[:20] + ("..." if len(text) > 20 else "")
+    preview = preview_text(first_para_w_text.text)
     log.info(
         f"The first paragraph containing text begins with: {preview}. [pipeline:{pipeline_id}]"
     )
@@ -205,7 +214,7 @@ def load_and_validate_pptx(pptx_path: Path | str) -> presentation.Presentation:
         )
         raise ValueError("Presentation contains no slides.")
 
-    first_slide = _find_first_slide_with_text(list(prs.slides))
+    first_slide = _find_first_slide_with_text(prs.slides)
     if first_slide is None:
         log.error(
             f"No slides in {str(pptx_path)} contain text content. [pipeline:{pipeline_id}]"
@@ -220,16 +229,14 @@ def load_and_validate_pptx(pptx_path: Path | str) -> presentation.Presentation:
         f"The pptx file {pptx_path} has {slide_count} slide(s) in it. [pipeline:{pipeline_id}]"
     )
 
-    first_slide_paragraphs = get_slide_paragraphs(first_slide)
-
     log.info(
         f"The first slide detected with text content is slide_id: {first_slide.slide_id} (inside presentation.xml). [pipeline:{pipeline_id}]"
     )
 
-    for p in first_slide_paragraphs:
+    # The preview only needs the first paragraph with text, so walk the slide lazily
+    for p in iter_slide_paragraphs(first_slide):
         if p.text.strip():
-            text = p.text.strip()
-            preview = text[:20] + ("..." if len(text) > 20 else "")
+            preview = preview_text(p.text.strip())
             log.info(f"The first paragraph containing text begins with: {preview}")
             break
     # An else on a for-loop runs if we never hit break. This is here because I'm maybe-overly defensive in programming style.
@@ -258,14 +265,23 @@ def _find_first_docx_paragraph_with_text(
 
 
 # region _find_first_slide_with_text
-def _find_first_slide_with_text(slides: list[Slide]) -> Slide | None:
+def _find_first_slide_with_text(slides: Iterable[Slide]) -> Slide | None:
     """Find the first slide that contains any paragraphs with text content."""
     for slide in slides:
-        if get_slide_paragraphs(slide):
+        if _slide_has_any_paragraph(slide):
             return slide
     return None
 
 
+# endregion
+
+
+# region _slide_has_any_paragraph
+def _slide_has_any_paragraph(slide: Slide) -> bool:
+    """Check whether a slide has at least one text paragraph, stopping at the first one found."""
+    return next(iter_slide_paragraphs(slide), None) is not None
+
+
 # endregion
 # endregion
 
@@ -295,9 +311,11 @@ def save_output(save_object: OUTPUT_TYPE, cfg: UserConfig) -> Path:
 
     output_filepath = save_folder / timestamped_filename
 
-    # Attempt to save
+    # Attempt to save. The zip writer emits many small chunks per part, so hand it a file object with a large
+    # write buffer instead of letting it open the path with the default one.
     try:
-        save_object.save(str(output_filepath))
+        with open(output_filepath, "wb", buffering=_SAVE_BUFFER_SIZE) as output_file:
+            save_object.save(output_file)
         log.info(f"Successfully saved to {output_filepath}. [pipeline:{pipeline_id}]")
     except PermissionError as e:
         log.error(f"Save failed - permission denied [pipeline:{pipeline_id}]: {e}")
@@ -344,12 +362,11 @@ def _build_timestamped_output_filename(save_object: OUTPUT_TYPE) -> str:
         )
         raise RuntimeError(f"Unexpected output object type: {save_object}")
 
-    # Add a timestamp to the filename
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    name, ext = save_filename.rsplit(
-        ".", 1
-    )  # The 1 is telling rsplit() to split from the right side and do a maximum of 1 split.
-    timestamped_filename = f"{name}_{timestamp}.{ext}"
+    # Add a timestamp to the filename. time.strftime() formats the local time directly, no datetime object needed.
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+    # with_stem() keeps the suffix as-is (and also copes with a filename that has no dot)
+    base = Path(save_filename)
+    timestamped_filename = base.with_stem(f"{base.stem}_{timestamp}").name
 
     return timestamped_filename
 
@@ -368,7 +385,8 @@ def _validate_content_size(save_object: OUTPUT_TYPE) -> None:
             )
     elif isinstance(save_object, presentation.Presentation):
         max_s_count = 1000
-        if len(list(save_object.slides)) > max_s_count:  # type: ignore[reportAttributeAccessIssue]
+        # Slides supports len() directly, so there's no need to build a list just to count it
+        if len(save_object.slides) > max_s_count:  # type: ignore[reportAttributeAccessIssue]
             log.warning(
                 f"This is about to save a pptx file with over {max_s_count} slides ... that seems a bit long!"
             )
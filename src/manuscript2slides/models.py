@@ -79,11 +79,11 @@ class Endnote_docx:
 
 
 # region Chunk_docx
-@dataclass
+@dataclass(slots=True)
 class Chunk_docx:
     """Class for Chunk objects made from docx paragraphs and their associated annotations."""
 
-    from typing import Optional
+    # One of these is made per slide, so use slots to skip the per-instance __dict__.
 
     # Page or slide where this chunk came from
     original_sequence_number: int = 0
@@ -91,18 +91,11 @@ class Chunk_docx:
     # Use "default_factory" to ensure every chunk gets its own list.
     # (Lists are mutable; it is a common error/bug to accidentally assign one list
     # shared amongst every instance of a class, rather than one per instance.)
-    paragraphs: list[Paragraph_docx] = field(default_factory=list[Paragraph_docx])
-
-    comments: list[Comment_docx_custom] = field(
-        default_factory=list[Comment_docx_custom]
-    )
-    footnotes: list[Footnote_docx] = field(default_factory=list[Footnote_docx])
-    endnotes: list[Endnote_docx] = field(default_factory=list[Endnote_docx])
-
-    @classmethod
-    def create_with_paragraph(cls, paragraph: Paragraph_docx) -> "Chunk_docx":
-        """Create a new instance of a Chunk_docx object but also populate the paragraphs list with an initial element."""
-        return cls(paragraphs=[paragraph])
+    paragraphs: list[Paragraph_docx] = field(default_factory=list)
+
+    comments: list[Comment_docx_custom] = field(default_factory=list)
+    footnotes: list[Footnote_docx] = field(default_factory=list)
+    endnotes: list[Endnote_docx] = field(default_factory=list)
 
     def add_paragraph(self, new_paragraph: Paragraph_docx) -> None:
         """Add a paragraph to this Chunk object's paragraphs list."""
@@ -3,8 +3,14 @@
 All strategies break a new chunk on a docx page break to prevent slide text overflow."""
 
 import logging
+from functools import lru_cache
+from typing import Callable
 
 from docx import document
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.text.paragraph import CT_P
+from docx.text.paragraph import Paragraph as Paragraph_docx
+from lxml import etree
 
 from manuscript2slides.internals.define_config import ChunkType
 from manuscript2slides.internals.run_context import get_pipeline_run_id
@@ -22,15 +28,9 @@ def create_docx_chunks(
     contents, either from paragraph, heading (heading_nested or heading_flat),
     or page. Defaults to paragraph.
     """
-    if chunk_type == ChunkType.HEADING_FLAT:
-        chunks = chunk_by_heading_flat(doc)
-    elif chunk_type == ChunkType.HEADING_NESTED:
-        chunks = chunk_by_heading_nested(doc)
-    elif chunk_type == ChunkType.PAGE:
-        chunks = chunk_by_page(doc)
-    else:
-        chunks = chunk_by_paragraph(doc)
-    return chunks
+    # _CHUNKERS is defined below the chunking functions it maps to
+    chunker = _CHUNKERS.get(chunk_type, chunk_by_paragraph)
+    return chunker(doc)
 
 
 # endregion
@@ -51,21 +51,29 @@ def chunk_by_paragraph(doc: document.Document) -> list[Chunk_docx]:
     # Start at page 1
     current_page_number = 1
 
+    # Check the log level once (every chunker below does the same); building the per-paragraph debug message
+    # reads para.text, which joins every run.
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    page_break_paragraphs = find_page_break_paragraphs(doc)
+
     for para in doc.paragraphs:
-        if para.contains_page_break:
+        if para._p in page_break_paragraphs:
             # Increment page count
             current_page_number = current_page_number + 1
 
         # Skip empty paragraphs (but keep those that are new-lines to respect intentional whitespace newlines)
-        if para.text == "":
-            log.debug("Skipping empty paragraph.")
+        if is_empty_paragraph(para):
+            if debug_enabled:
+                log.debug("Skipping empty paragraph.")
             continue
 
-        log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
+        if debug_enabled:
+            log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
 
-        new_chunk = Chunk_docx.create_with_paragraph(para)
-        new_chunk.original_sequence_number = current_page_number
-        paragraph_chunks.append(new_chunk)
+        paragraph_chunks.append(
+            Chunk_docx(original_sequence_number=current_page_number, paragraphs=[para])
+        )
 
     log.info(
         f"We processed {len(paragraph_chunks)} paragraph chunks. [pipeline:{pipeline_id}]"
@@ -95,17 +103,25 @@ def chunk_by_page(doc: document.Document) -> list[Chunk_docx]:
         original_sequence_number=current_page_number
     )
 
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    page_break_paragraphs = find_page_break_paragraphs(doc)
+
     for para in doc.paragraphs:
-        if para.contains_page_break:
+        has_page_break = para._p in page_break_paragraphs
+
+        if has_page_break:
             # Increment page count
             current_page_number = current_page_number + 1
 
         # Skip empty paragraphs (keep intentional whitespace newlines)
-        if para.text == "":
-            log.debug("Skipping empty paragraph.")
+        if is_empty_paragraph(para):
+            if debug_enabled:
+                log.debug("Skipping empty paragraph.")
             continue
 
-        log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
+        if debug_enabled:
+            log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
 
         # If the current_page_chunk is empty, append the current para regardless of style & continue to next para.
         if not current_page_chunk.paragraphs:
@@ -113,14 +129,15 @@ def chunk_by_page(doc: document.Document) -> list[Chunk_docx]:
             continue
 
         # Handle page breaks - create new chunk and start fresh
-        if para.contains_page_break:
+        if has_page_break:
             # Add the current_chunk to chunks list (if it has content)
-            if current_page_chunk:
+            if current_page_chunk.paragraphs:
                 all_chunks.append(current_page_chunk)
 
             # Start new chunk with this paragraph
-            current_page_chunk = Chunk_docx.create_with_paragraph(para)
-            current_page_chunk.original_sequence_number = current_page_number
+            current_page_chunk = Chunk_docx(
+                original_sequence_number=current_page_number, paragraphs=[para]
+            )
 
             continue
 
@@ -128,7 +145,7 @@ def chunk_by_page(doc: document.Document) -> list[Chunk_docx]:
         current_page_chunk.add_paragraph(para)
 
     # Ensure final chunk from loop is added to chunks list
-    if current_page_chunk:
+    if current_page_chunk.paragraphs:
         all_chunks.append(current_page_chunk)
 
     log.info(f"We processed {len(all_chunks)} page chunks. [pipeline:{pipeline_id}]")
@@ -188,69 +205,81 @@ def chunk_by_heading_nested(doc: document.Document) -> list[Chunk_docx]:
     all_chunks: list[Chunk_docx] = []
     current_chunk: Chunk_docx = Chunk_docx(original_sequence_number=current_page_number)
 
-    # Initialize current_heading_style_name
-    current_heading_style_name = "Normal"  # Default for documents without headings
+    # Track the level of the current heading itself, so it's only worked out when the heading changes.
+    # Start "deepest possible" (as for "Normal"), for documents without headings.
+    current_heading_level: int | float = float("inf")
+
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    page_break_paragraphs = find_page_break_paragraphs(doc)
+
+    # Style id -> style name, filled in as get_paragraph_style_name() meets each style
+    style_names: dict[str | None, str] = {}
 
     for i, para in enumerate(doc.paragraphs):
-        if para.contains_page_break:
+        has_page_break = para._p in page_break_paragraphs
+
+        if has_page_break:
             # Increment page number
             current_page_number = current_page_number + 1
 
         # Skip empty paragraphs
-        if para.text == "":
-            log.debug("Skipping empty paragraph.")
+        if is_empty_paragraph(para):
+            if debug_enabled:
+                log.debug("Skipping empty paragraph.")
             continue
 
-        # Set a style_name to make Pylance happy (it gets mad if we direct-check para.style.style_name later)
-        style_name = para.style.name if para.style and para.style.name else "Normal"
+        style_name = get_paragraph_style_name(para, style_names)
 
-        log.debug(
-            f"Paragraph begins: {para.text[:30]}... and is index: {i}. [pipeline:{pipeline_id}]"
-        )
+        if debug_enabled:
+            log.debug(
+                f"Paragraph begins: {para.text[:30]}... and is index: {i}. [pipeline:{pipeline_id}]"
+            )
 
         # If the current_chunk is empty, append the current para regardless of style & continue to next para.
         if not current_chunk.paragraphs:
             current_chunk.add_paragraph(para)
             if is_standard_heading(style_name):
-                current_heading_style_name = style_name
+                current_heading_level = get_heading_level(style_name)
             continue
 
         # Handle page breaks - create new chunk and start fresh
-        if para.contains_page_break:
+        if has_page_break:
             # Add the current chunk to chunks list (if it has content)
-            if current_chunk:
+            if current_chunk.paragraphs:
                 all_chunks.append(current_chunk)
 
             # Start new chunk with this paragraph
-            current_chunk = Chunk_docx.create_with_paragraph(para)
-            current_chunk.original_sequence_number = current_page_number
+            current_chunk = Chunk_docx(
+                original_sequence_number=current_page_number, paragraphs=[para]
+            )
 
             # Update heading depth if this paragraph is a heading
             if is_standard_heading(style_name):
-                current_heading_style_name = style_name
+                current_heading_level = get_heading_level(style_name)
             continue
 
         # Handle headings
         if is_standard_heading(style_name):
+            heading_level = get_heading_level(style_name)
+
             # Check if this heading is at same level or higher (less deep) than current. Smaller numbers are higher up in the hierarchy.
-            if get_heading_level(style_name) <= get_heading_level(
-                current_heading_style_name
-            ):
+            if heading_level <= current_heading_level:
                 # If yes, start a new chunk
-                if current_chunk:
+                if current_chunk.paragraphs:
                     all_chunks.append(current_chunk)
-                current_chunk = Chunk_docx.create_with_paragraph(para)
-                current_chunk.original_sequence_number = current_page_number
-                current_heading_style_name = style_name
+                current_chunk = Chunk_docx(
+                    original_sequence_number=current_page_number, paragraphs=[para]
+                )
             else:
                 # This heading is deeper, add to current chunk
                 current_chunk.add_paragraph(para)
-                current_heading_style_name = style_name
+            current_heading_level = heading_level
         else:
             # Normal paragraph - add to current chunk
             current_chunk.add_paragraph(para)
 
-    if current_chunk:
+    if current_chunk.paragraphs:
         all_chunks.append(current_chunk)
 
     log.info(
@@ -311,20 +340,29 @@ def chunk_by_heading_flat(doc: document.Document) -> list[Chunk_docx]:
     all_chunks: list[Chunk_docx] = []
     current_chunk: Chunk_docx = Chunk_docx(original_sequence_number=current_page_number)
 
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    page_break_paragraphs = find_page_break_paragraphs(doc)
+
+    style_names: dict[str | None, str] = {}
+
     for para in doc.paragraphs:
-        if para.contains_page_break:
+        has_page_break = para._p in page_break_paragraphs
+
+        if has_page_break:
             # Increment page count
             current_page_number = current_page_number + 1
 
         # Skip empty paragraphs
-        if para.text == "":
-            log.debug("Skipping empty paragraph.")
+        if is_empty_paragraph(para):
+            if debug_enabled:
+                log.debug("Skipping empty paragraph.")
             continue
 
-        # Set a style_name to make Pylance happy (it gets mad if we direct-check para.style.name later)
-        style_name = para.style.name if para.style and para.style.name else "Normal"
+        style_name = get_paragraph_style_name(para, style_names)
 
-        log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
+        if debug_enabled:
+            log.debug(f"Paragraph begins: {para.text[:30]}... [pipeline:{pipeline_id}]")
 
         # If the current_chunk is empty, append the current para regardless of style & continue to next para.
         if not current_chunk.paragraphs:
@@ -332,31 +370,33 @@ def chunk_by_heading_flat(doc: document.Document) -> list[Chunk_docx]:
             continue
 
         # Handle page breaks - always start a new chunk
-        if para.contains_page_break:
+        if has_page_break:
             # Add the current chunk to chunks list (if it has content)
-            if current_chunk:
+            if current_chunk.paragraphs:
                 all_chunks.append(current_chunk)
 
             # Start new chunk with this paragraph
-            current_chunk = Chunk_docx.create_with_paragraph(para)
-            current_chunk.original_sequence_number = current_page_number
+            current_chunk = Chunk_docx(
+                original_sequence_number=current_page_number, paragraphs=[para]
+            )
             continue
 
         # If this paragraph is a heading, start a new chunk
         if is_standard_heading(style_name):
             # If we already have content in current_chunk, save it and start fresh
-            if current_chunk:
+            if current_chunk.paragraphs:
                 all_chunks.append(current_chunk)
 
             # Start new chunk with this paragraph
-            current_chunk = Chunk_docx.create_with_paragraph(para)
-            current_chunk.original_sequence_number = current_page_number
+            current_chunk = Chunk_docx(
+                original_sequence_number=current_page_number, paragraphs=[para]
+            )
 
         else:
             # This is a normal paragraph - add it to current chunk
             current_chunk.add_paragraph(para)
 
-    if current_chunk:
+    if current_chunk.paragraphs:
         all_chunks.append(current_chunk)
 
     log.info(
@@ -368,10 +408,114 @@ def chunk_by_heading_flat(doc: document.Document) -> list[Chunk_docx]:
 # endregion
 
 
+# region chunker lookup
+
+# Which chunking function create_docx_chunks() uses for each chunk type
+_CHUNKERS: dict[ChunkType, Callable[[document.Document], list[Chunk_docx]]] = {
+    ChunkType.HEADING_FLAT: chunk_by_heading_flat,
+    ChunkType.HEADING_NESTED: chunk_by_heading_nested,
+    ChunkType.PAGE: chunk_by_page,
+    ChunkType.PARAGRAPH: chunk_by_paragraph,
+}
+
+# endregion
+
+
+# region paragraph helpers
+
+# Paragraph.text is joined from these run children (see python-docx's CT_R.text), for runs that sit directly in
+# the paragraph or inside one of its hyperlinks. Compiled once so lxml can evaluate it for each paragraph in C.
+_TEXT_CHILD_TEST = " or ".join(
+    f"self::{tag}"
+    for tag in ("w:t", "w:tab", "w:br", "w:cr", "w:noBreakHyphen", "w:ptab")
+)
+_PARAGRAPH_TEXT_ELEMENTS = etree.XPath(
+    f"./w:r/*[{_TEXT_CHILD_TEST}] | ./w:hyperlink/w:r/*[{_TEXT_CHILD_TEST}]",
+    namespaces=nsmap,
+)
+
+
+_W_LAST_RENDERED_PAGE_BREAK = qn("w:lastRenderedPageBreak")
+_W_R = qn("w:r")
+_W_HYPERLINK = qn("w:hyperlink")
+_W_P = qn("w:p")
+
+
+# region is_empty_paragraph
+def is_empty_paragraph(para: Paragraph_docx) -> bool:
+    """
+    Check if a paragraph's text is empty, without building the paragraph's whole text string.
+
+    Looks at the same elements Paragraph.text is built from and stops at the first one that contributes
+    any characters (an empty <w:t> or a page-type <w:br> contributes none).
+    """
+    return not any(str(el) for el in _PARAGRAPH_TEXT_ELEMENTS(para._p))
+
+
+# endregion
+
+
+# region find_page_break_paragraphs
+def find_page_break_paragraphs(doc: document.Document) -> set[CT_P]:
+    """
+    Find every paragraph element whose contains_page_break would be True, in one walk over the document body.
+
+    contains_page_break runs its own XPath query each time it's read; checking membership in this set instead
+    keeps the chunkers from querying every paragraph they visit.
+    """
+    page_break_paragraphs: set[CT_P] = set()
+
+    # Same rule as python-docx: a rendered page break counts when it sits in a run directly in the paragraph,
+    # or in a run inside one of the paragraph's hyperlinks.
+    for page_break in doc.element.body.iter(_W_LAST_RENDERED_PAGE_BREAK):
+        run = page_break.getparent()
+        if run is None or run.tag != _W_R:
+            continue
+        parent = run.getparent()
+        if parent is not None and parent.tag == _W_HYPERLINK:
+            parent = parent.getparent()
+        if parent is not None and parent.tag == _W_P:
+            page_break_paragraphs.add(parent)
+
+    return page_break_paragraphs
+
+
+# endregion
+
+
+# region get_paragraph_style_name
+def get_paragraph_style_name(
+    para: Paragraph_docx, style_names: dict[str | None, str]
+) -> str:
+    """
+    Get a paragraph's style name, or "Normal" if it has none.
+
+    para.style looks the style up in the document's styles part on every access, but a document only uses
+    a handful of styles. So we key the resolved name by the paragraph's style id (read straight off its
+    XML) and only go through python-docx the first time we see each id.
+    """
+    style_id = para._p.style
+    style_name = style_names.get(style_id)
+    if style_name is None:
+        style = para.style
+        style_name = style.name if style and style.name else "Normal"
+        style_names[style_id] = style_name
+    return style_name
+
+
+# endregion
+
+# endregion
+
+
 # region heading helpers
 
+# The heading helpers below are pure functions of a style name, and a document only uses a handful of style names,
+# so cache their answers instead of redoing the string parsing (and, for non-headings, the int() failure) per paragraph.
+
 
 # region _is_standard_heading
+@lru_cache(maxsize=256)
 def is_standard_heading(style_name: str) -> bool:
     """Check if paragraph.style.name is a standard Word Heading (Heading 1, Heading 2, ..., Heading 6)"""
     return style_name.startswith("Heading") and style_name[8:].isdigit()
@@ -381,6 +525,7 @@ def is_standard_heading(style_name: str) -> bool:
 
 
 # region get_heading_level
+@lru_cache(maxsize=256)
 def get_heading_level(style_name: str) -> int | float:
     """
     Extract the numeric level from a heading style name (e.g., 'Heading 2' -> 2),
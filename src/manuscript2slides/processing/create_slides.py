@@ -44,6 +44,10 @@ def slides_from_chunks(
             f"No slide layout found to match provided custom name, {constants.SLD_LAYOUT_CUSTOM_NAME}"
         )
 
+    annotate_notes = (
+        cfg.display_comments or cfg.display_footnotes or cfg.display_endnotes
+    )
+
     for chunk in chunks:
         # Skip chunks whose page range is outside the user-specified start/end range
         if (cfg.range_start and chunk.original_sequence_number < cfg.range_start) or (
@@ -66,12 +70,9 @@ def slides_from_chunks(
         # For each paragraph in this chunk, handle adding it
         for i, paragraph in enumerate(chunk.paragraphs):
             # Creating a new slide and a text frame leaves an empty paragraph in place, even when clearing it.
-            # So if we're at the start of our list, use that existing empty paragraph.
-            if (
-                i == 0
-                and len(text_frame.paragraphs) > 0
-                and not text_frame.paragraphs[0].text
-            ):
+            # So if we're at the start of our list, use that existing empty paragraph. (TextFrame.clear() in
+            # create_blank_slide_for_chunk() always leaves exactly one, so there's no need to inspect it.)
+            if i == 0:
                 # Use the existing first/0th paragraph
                 pptx_paragraph = text_frame.paragraphs[0]
             else:
@@ -103,6 +104,11 @@ def slides_from_chunks(
         if experimental_formatting:
             slide_metadata["experimental_formatting"] = experimental_formatting
 
+        # Touching notes_slide creates a notes slide part (and the notes master, the first time) for this slide,
+        # so only do it when we're actually going to write speaker notes.
+        if not (annotate_notes or cfg.preserve_docx_metadata_in_speaker_notes):
+            continue
+
         notes_text_frame = new_slide.notes_slide.notes_text_frame
 
         if notes_text_frame is None:
@@ -113,7 +119,7 @@ def slides_from_chunks(
                 "This slide doesn't seem to have a notes text frame. This should never happen, but it's possible for the notes_slide or notes_text_frame properties to return None if the notes placeholder has been removed from the notes master or the notes slide itself."
             )
 
-        if cfg.display_comments or cfg.display_footnotes or cfg.display_endnotes:
+        if annotate_notes:
             annotate_slide(chunk, notes_text_frame, cfg)
 
         if cfg.preserve_docx_metadata_in_speaker_notes:
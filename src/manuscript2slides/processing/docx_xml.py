@@ -1,18 +1,22 @@
 """Docx XML parsing utilities for extracting data exposed by existing interop libraries."""
 
+import io
 import logging
 import re
 import xml.etree.ElementTree as ET
-from typing import TypeVar
+from typing import Iterator, TypeVar
 
 from docx import document
 from docx.opc.part import Part
+from docx.oxml.ns import qn
 from docx.text.run import Run as Run_docx
 
 from manuscript2slides.models import Endnote_docx, Footnote_docx
 
 log = logging.getLogger("manuscript2slides")
 
+_W_INSTR_TEXT = qn("w:instrText")
+
 
 # region parse_xml_blob
 def parse_xml_blob(xml_blob: bytes | str) -> ET.Element:
@@ -40,6 +44,27 @@ def parse_xml_blob(xml_blob: bytes | str) -> ET.Element:
 # endregion
 
 
+# region iterparse_xml_blob
+def iterparse_xml_blob(xml_blob: bytes, tag: str) -> Iterator[ET.Element]:
+    """
+    Stream the elements with the given (Clark-notation) tag out of an XML blob, without building the whole tree first.
+
+    Each element is cleared once the caller moves on to the next one, so read everything you need from it before then.
+    """
+    try:
+        for _event, elem in ET.iterparse(io.BytesIO(xml_blob), events=("end",)):
+            if elem.tag == tag:
+                yield elem
+                # Drop this element's children and text now that the caller is done with it
+                elem.clear()
+    except ET.ParseError as e:
+        log.error(f"Malformed XML: {e}")
+        raise ValueError(f"XML is malformed: {e}") from e
+
+
+# endregion
+
+
 # region find_xml_parts
 def find_xml_parts(doc: document.Document, part_name: str) -> list[Part]:
     """Find XML parts matching the given name (e.g., 'footnotes.xml')"""
@@ -69,27 +94,13 @@ def detect_field_code_hyperlinks(run: Run_docx) -> None | str:
     Detect if this docx Run has a field code for instrText and it begins with HYPERLINK.
     If so, report it to the user, because we do not handle adding these to the pptx output.
     """
-    try:
-        run_xml: str = run.element.xml
-        if "instrText" not in run_xml or "HYPERLINK" not in run_xml:
-            return None
-        root = ET.fromstring(run_xml)
-
-        # Find instrText elements
-        instr_texts = root.findall(
-            ".//w:instrText",
-            {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"},
-        )
-        for instr in instr_texts:
-            if instr.text and instr.text.startswith("HYPERLINK"):
-                match = re.search(r'HYPERLINK\s+"([^"]+)"', instr.text)
-                if match and match.group(1):
-                    return match.group(1)
-
-    except (AttributeError, ET.ParseError) as e:
-        log.warning(
-            f"Could not parse run XML for field codes: {e} while seeking instrText"
-        )
+    # Look for instrText directly in the run's live XML element; serializing every run to a string just to search
+    # it would cost far more than this rarely-matching probe.
+    for instr in run.element.iter(_W_INSTR_TEXT):
+        if instr.text and instr.text.startswith("HYPERLINK"):
+            match = re.search(r'HYPERLINK\s+"([^"]+)"', instr.text)
+            if match and match.group(1):
+                return match.group(1)
 
     return None
 
@@ -118,27 +118,29 @@ def _copy_basic_font_formatting(
     source_font: Union[Font_docx, Font_pptx], target_font: Union[Font_docx, Font_pptx]
 ) -> None:
     """Extract common formatting logic for Runs (or Paragraphs)."""
-
-    if source_font.name is not None:
-        target_font.name = source_font.name
+    # Each font property read walks the element's XML, so read each one only once.
+    name = source_font.name
+    if name is not None:
+        target_font.name = name
 
     # Bold/Italics: Only overwrite when explicitly set on the source (avoid clobbering inheritance)
-    if source_font.bold is not None:
-        target_font.bold = source_font.bold
-    if source_font.italic is not None:
-        target_font.italic = source_font.italic
+    bold = source_font.bold
+    if bold is not None:
+        target_font.bold = bold
+    italic = source_font.italic
+    if italic is not None:
+        target_font.italic = italic
 
     # Underline: Handle both boolean and enum values
-    if source_font.underline is not None:
+    underline = source_font.underline
+    if underline is not None:
         # Check if it's a boolean (True/False/None)
-        if isinstance(source_font.underline, bool):
-            target_font.underline = source_font.underline
+        if isinstance(underline, bool):
+            target_font.underline = underline
         else:
             # It's a WD_UNDERLINE enum - map to MSO_TEXT_UNDERLINE_TYPE
             # Use mapped value if available, otherwise fall back to simple boolean
-            target_font.underline = UNDERLINE_MAP_WD2MSO.get(
-                source_font.underline, bool(source_font.underline)
-            )
+            target_font.underline = UNDERLINE_MAP_WD2MSO.get(underline, bool(underline))
 
 
 # endregion
@@ -148,8 +150,9 @@ def _copy_basic_font_formatting(
 def _copy_font_size_formatting(
     source_font: Union[Font_docx, Font_pptx], target_font: Union[Font_docx, Font_pptx]
 ) -> None:
-    if source_font.size is not None:
-        target_font.size = Pt(source_font.size.pt)
+    size = source_font.size
+    if size is not None:
+        target_font.size = Pt(size.pt)
         """
         <a:r>
             <a:rPr lang="en-US" sz="8800" i="1" dirty="0"/>
@@ -165,8 +168,13 @@ def _copy_font_size_formatting(
 def _copy_font_color_formatting(
     source_font: Union[Font_docx, Font_pptx], target_font: Union[Font_docx, Font_pptx]
 ) -> None:
-    # Color: copy only if source has an explicit RGB
-    src_rgb = getattr(getattr(source_font, "color", None), "rgb", None)
+    # Color: copy only if source has an explicit RGB.
+    # Both libraries' fonts always have .color; python-docx returns None for .rgb when there's no RGB color, while
+    # python-pptx raises AttributeError for colors that aren't RGB (e.g., no color set, or a theme color).
+    try:
+        src_rgb = source_font.color.rgb
+    except AttributeError:
+        src_rgb = None
     if src_rgb is not None:
         if isinstance(target_font, Font_pptx):
             target_font.color.rgb = RGBColor_pptx(*src_rgb)
@@ -203,7 +211,14 @@ def copy_run_formatting_docx2pptx(
     sfont = source_run.font
     tfont = target_run.font
 
-    target_run.text = source_run.text
+    # Run.text is rebuilt from the run's XML children on every access, so read it once
+    run_text = source_run.text
+    target_run.text = run_text
+
+    # A run without run properties (<w:rPr>) has no direct formatting at all; everything it looks like comes
+    # from its paragraph style, which we copy at the paragraph level. Skip reading each font property as None.
+    if source_run._r.rPr is None:
+        return
 
     _copy_basic_font_formatting(sfont, tfont)
 
@@ -212,7 +227,7 @@ def copy_run_formatting_docx2pptx(
     _copy_font_color_formatting(sfont, tfont)
 
     if cfg.experimental_formatting_on:
-        if source_run.text and source_run.text.strip():
+        if run_text.strip():
             _copy_experimental_formatting_docx2pptx(
                 source_run, target_run, experimental_formatting_metadata
             )
@@ -242,17 +257,18 @@ def _copy_experimental_formatting_docx2pptx(
     # Author: Martin Packer
     # License: MIT
     try:
-        if sfont.highlight_color is not None:
+        highlight_color = sfont.highlight_color
+        if highlight_color is not None:
             experimental_formatting_metadata.append(
                 {
                     "ref_text": source_run.text,
-                    "highlight_color_enum": sfont.highlight_color.name,
+                    "highlight_color_enum": highlight_color.name,
                     "formatting_type": "highlight",
                 }
             )
             try:
                 # Convert the docx run highlight color to a hex string
-                tfont_hex_str = COLOR_MAP_HEX.get(sfont.highlight_color)
+                tfont_hex_str = COLOR_MAP_HEX.get(highlight_color)
 
                 # Create an object to represent this run in memory
                 rPr = target_run._r.get_or_add_rPr()
@@ -596,7 +612,9 @@ def _copy_experimental_formatting_pptx2docx(
         # Check for highlight nested element
         highlight = root.find(".//a:highlight/a:srgbClr", ns)
         if highlight is not None:
-            log.debug(f"Found highlight in pptx run: {source_run.text[:30]}...")
+            # Only build the preview (which re-reads the run text) when debug logging is on
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Found highlight in pptx run: {source_run.text[:30]}...")
             # Extract the color HEX out of the XML
             hex_color = highlight.get("val")
             if hex_color:
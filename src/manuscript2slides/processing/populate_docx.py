@@ -10,8 +10,7 @@ and creating comments for user notes and unmatched annotations.
 
 # region imports
 import logging
-import re
-from typing import Union
+from typing import Iterator, Union
 
 from docx import document
 from docx.comments import Comment as Comment_docx
@@ -22,7 +21,11 @@ from pptx.slide import NotesSlide, Slide
 from pptx.text.text import TextFrame
 from pptx.text.text import _Paragraph as Paragraph_pptx
 
-from manuscript2slides.annotations.restore_from_slides import split_speaker_notes
+from manuscript2slides.annotations.restore_from_slides import (
+    safely_extract_comment_data,
+    safely_extract_experimental_formatting_data,
+    split_speaker_notes,
+)
 from manuscript2slides.internals.define_config import UserConfig
 from manuscript2slides.models import SlideNotes
 from manuscript2slides.processing.formatting import copy_paragraph_formatting_pptx2docx
@@ -57,8 +60,12 @@ def copy_slides_to_docx_body(
             continue
 
         # If there's slide notes, process them into a SlideNotes object; otherwise, make an empty one.
-        if slide.has_notes_slide and slide.notes_slide.notes_text_frame is not None:
-            slide_notes = split_speaker_notes(slide.notes_slide.notes_text_frame.text)
+        # notes_slide and notes_text_frame each look up their part/placeholder on access, so read them once.
+        notes_text_frame = (
+            slide.notes_slide.notes_text_frame if slide.has_notes_slide else None
+        )
+        if notes_text_frame is not None:
+            slide_notes = split_speaker_notes(notes_text_frame.text)
         else:
             slide_notes = SlideNotes()
 
@@ -82,11 +89,37 @@ def process_slide_paragraphs(
 
     slide_paragraphs: list[Paragraph_pptx] = get_slide_paragraphs(slide)
 
-    unmatched_annotations = []
     matched_comment_ids: set[int] = set()
 
+    # Validate each stored comment once per slide, instead of once per run
+    comment_records: list[tuple[dict, dict]] = []
+    for comment in slide_notes.comments:
+        comment_data = safely_extract_comment_data(comment)
+        if comment_data is None:
+            log.debug(f"Skipping invalid comment: {comment}")
+            continue
+        comment_records.append((comment_data, comment))
+
+    # Likewise, validate the experimental formatting records once per slide, and only if the user wants them applied
+    experimental_formatting_records: list[dict] = []
+    if cfg.experimental_formatting_on:
+        experimental_formatting_records = [
+            exp_fmt
+            for exp_fmt in slide_notes.experimental_formatting
+            if safely_extract_experimental_formatting_data(exp_fmt) is not None
+        ]
+
     last_run = None
 
+    # Map each stored heading's stripped text to its style name once per slide, rather than re-stripping every heading
+    # for every paragraph. Iterate in reverse so the first heading with a given text wins, as the old linear scan did.
+    heading_style_by_text: dict[str, str] = {}
+    if slide_notes and slide_notes.has_metadata and slide_notes.headings:
+        heading_style_by_text = {
+            heading["text"].strip(): heading["name"]
+            for heading in reversed(slide_notes.headings)
+        }
+
     # For every pptx paragraph.....
     for pptx_para in slide_paragraphs:
         # Make a new docx para
@@ -94,15 +127,20 @@ def process_slide_paragraphs(
         copy_paragraph_formatting_pptx2docx(pptx_para, new_para)
 
         # If the text of this paragraph exactly matches a previous heading's text, apply that heading style
-        if slide_notes and slide_notes.has_metadata and slide_notes.headings:
-            for heading in slide_notes.headings:
-                if heading["text"].strip() == pptx_para.text.strip():
-                    new_para.style = heading["name"]
-                    break  # we should only ever apply one style to a paragraph
+        if heading_style_by_text:
+            heading_style = heading_style_by_text.get(pptx_para.text.strip())
+            if heading_style:
+                new_para.style = heading_style
 
         for run in pptx_para.runs:
             last_run = process_pptx_run(
-                run, new_para, new_doc, slide_notes, matched_comment_ids, cfg
+                run,
+                new_para,
+                new_doc,
+                comment_records,
+                matched_comment_ids,
+                experimental_formatting_records,
+                cfg,
             )
 
     # Put the slide's user notes into a new comment attached to the last run
@@ -115,15 +153,16 @@ def process_slide_paragraphs(
                 f"Added a new comment with this slide's user notes: {user_notes_comment}"
             )
 
-    # Find all the unmatched annotations for this slide by getting the complement set(s)
+    # Find all the unmatched annotations for this slide by getting the complement set(s), reusing the validated
+    # comment records rather than re-scanning slide_notes.comments.
     # (Only comments are supported, for now, but if we ever add footnote/endnote support,
     # we'll need 3 sets2lists here.)
-    unmatched_comments = [
-        c for c in slide_notes.comments if c["id"] not in matched_comment_ids
+    unmatched_annotations = [
+        comment
+        for comment_data, comment in comment_records
+        if comment_data["id"] not in matched_comment_ids
     ]
 
-    unmatched_annotations.extend(unmatched_comments)
-
     # If python-docx ever provides support for adding footnotes/endnotes,
     # we'll need to change the code to do matching above like we do with comments,
     # and only add the unmatched items here.
@@ -214,16 +253,20 @@ def copy_unmatched_comments_to_new_comment(
 
 
 # region _sanitize_xml_text
+
+# NULL bytes and control characters (except tab, newline, carriage return), mapped to None for str.translate()
+_XML_INVALID_CHARS = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
+
 def _sanitize_xml_text(text: str) -> str:
     """Remove characters that aren't valid in XML."""
     if not text:
         return ""
 
-    # Remove NULL bytes and control characters (except tab, newline, carriage return)
-    sanitized = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
-
-    # Ensure it's a proper string
-    return str(sanitized)
+    # str.translate() deletes every mapped character in one C-level pass, without going through the regex engine
+    return text.translate(_XML_INVALID_CHARS)
 
 
 # endregion
@@ -232,20 +275,23 @@ def _sanitize_xml_text(text: str) -> str:
 # region get_slide_paragraphs
 def get_slide_paragraphs(slide: Union[Slide, NotesSlide]) -> list[Paragraph_pptx]:
     """Extract all paragraphs from all text placeholders in a slide."""
-    paragraphs: list[Paragraph_pptx] = []
+    return list(iter_slide_paragraphs(slide))
 
-    for placeholder in slide.placeholders:  # pyright: ignore[reportGeneralTypeIssues]
-        if (
-            isinstance(placeholder, SlidePlaceholder)
-            and hasattr(placeholder, "text_frame")
-            and placeholder.text_frame
-        ):
-            textf: TextFrame = placeholder.text_frame
-            for para in textf.paragraphs:
-                if para.runs or para.text:
-                    paragraphs.append(para)
 
-    return paragraphs
+def iter_slide_paragraphs(
+    slide: Union[Slide, NotesSlide],
+) -> Iterator[Paragraph_pptx]:
+    """Lazily yield the paragraphs from all text placeholders in a slide, so callers can stop at the first hit."""
+    for placeholder in slide.placeholders:  # pyright: ignore[reportGeneralTypeIssues]
+        if not isinstance(placeholder, SlidePlaceholder):
+            continue
+        # text_frame builds a new TextFrame wrapper on every access, so fetch it once
+        textf: TextFrame | None = getattr(placeholder, "text_frame", None)
+        if not textf:
+            continue
+        for para in textf.paragraphs:
+            if para.runs or para.text:
+                yield para
 
 
 # endregion
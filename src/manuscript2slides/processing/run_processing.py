@@ -6,6 +6,7 @@
 # mypy: disable-error-code="import-untyped"
 
 # region imports
+import copy
 import logging
 from typing import Any
 
@@ -20,12 +21,7 @@ from docx.text.run import Run as Run_docx
 from pptx.text.text import _Paragraph as Paragraph_pptx
 from pptx.text.text import _Run as Run_pptx
 
-from manuscript2slides.annotations.restore_from_slides import (
-    safely_extract_comment_data,
-    safely_extract_experimental_formatting_data,
-)
 from manuscript2slides.internals.define_config import UserConfig
-from manuscript2slides.models import SlideNotes
 from manuscript2slides.processing.docx_xml import detect_field_code_hyperlinks
 from manuscript2slides.processing.formatting import (
     apply_experimental_formatting_from_metadata,
@@ -38,6 +34,11 @@ from manuscript2slides.processing.formatting import (
 
 log = logging.getLogger("manuscript2slides")
 
+# Empty w:hyperlink element that add_hyperlink_to_docx_paragraph() clones; deepcopy of an existing element is cheaper
+# than building a new one through the oxml parser every time.
+_HYPERLINK_PROTOTYPE = OxmlElement_docx("w:hyperlink")
+_R_ID = qn("r:id")
+
 
 # region process_docx_paragraph_inner_contents
 def process_docx_paragraph_inner_contents(
@@ -140,20 +141,28 @@ def process_pptx_run(
     run: Run_pptx,
     new_para: Paragraph_docx,
     new_doc: document.Document,
-    slide_notes: SlideNotes,
+    comment_records: list[tuple[dict, dict]],
     matched_comment_ids: set,
+    experimental_formatting_records: list[dict],
     cfg: UserConfig,
 ) -> Run_docx:
     """
     Process a single run from a pptx slide paragraph by copying its basic formatting into a new docx run, and detecting if its text content
     matches experimental formatting metadata, and/or comment metadata from the speaker notes JSON.
+
+    The comment and experimental formatting records come from the slide's speaker notes and are validated once per
+    slide by the caller.
     """
 
     # Handle adding hyperlinks versus regular runs, and the runs' basic formatting.
-    if run.hyperlink.address:
-        log.debug(f"Hyperlink address found: {run.hyperlink.address}")
+    # run.hyperlink builds a new wrapper and resolves the click action's relationship on each access, so read
+    # the address once for the check, the debug message, and the copy.
+    hyperlink_address = run.hyperlink.address
+    if hyperlink_address:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Hyperlink address found: {hyperlink_address}")
         run_from_hyperlink = add_hyperlink_to_docx_paragraph(
-            new_para, run.hyperlink.address, run.text
+            new_para, hyperlink_address, run.text
         )
         last_run = run_from_hyperlink
         copy_run_formatting_pptx2docx(run, run_from_hyperlink, cfg)
@@ -161,21 +170,18 @@ def process_pptx_run(
         last_run = new_para.add_run()
         copy_run_formatting_pptx2docx(run, last_run, cfg)
 
+    # Both metadata checks below compare against the run's text, so read it once
+    run_text = run.text if comment_records or experimental_formatting_records else ""
+
     # Check if this run contains matching text for comments from the this slide's speaker notes' stored JSON
-    # metadata, from previous docx2pptx pipeline processing
-    if slide_notes.comments:
-        # Check to see if the run text matches any comments' ref text
-        for comment in slide_notes.comments:
-            comment_data = safely_extract_comment_data(comment)
-
-            if comment_data is None:
-                log.debug(f"Skipping invalid comment: {comment}")
+    # metadata, from previous docx2pptx processing.
+    if comment_records:
+        # Check to see if the run text matches any still-unmatched comments' ref text
+        for comment_data, _comment in comment_records:
+            if comment_data["id"] in matched_comment_ids:
                 continue
 
-            if (
-                comment_data["reference_text"] in run.text
-                and comment_data["id"] not in matched_comment_ids
-            ):
+            if comment_data["reference_text"] in run_text:
                 new_doc.add_comment(
                     last_run,
                     comment_data["text"],
@@ -185,13 +191,10 @@ def process_pptx_run(
                 matched_comment_ids.add(comment_data["id"])
             # don't break; there can be multiple comments added to a single run
 
-    if cfg.experimental_formatting_on and slide_notes.experimental_formatting:
-        for exp_fmt in slide_notes.experimental_formatting:
-            fmt_info = safely_extract_experimental_formatting_data(exp_fmt)
-            if fmt_info is None:
-                continue
-            if exp_fmt["ref_text"] in run.text:
-                apply_experimental_formatting_from_metadata(last_run, exp_fmt)
+    # The caller only passes experimental formatting records when cfg.experimental_formatting_on is set
+    for exp_fmt in experimental_formatting_records:
+        if exp_fmt["ref_text"] in run_text:
+            apply_experimental_formatting_from_metadata(last_run, exp_fmt)
 
     return last_run
 
@@ -219,8 +222,8 @@ def add_hyperlink_to_docx_paragraph(
         r_id = part.relate_to(
             url, constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True
         )
-        hyperlink = OxmlElement_docx("w:hyperlink")
-        hyperlink.set(qn("r:id"), r_id)
+        hyperlink = copy.deepcopy(_HYPERLINK_PROTOTYPE)
+        hyperlink.set(_R_ID, r_id)
 
         # 2. Create the Run with PARAGRAPH as the parent (to avoid an XML .part error)
         # Use a new 'w:r' element
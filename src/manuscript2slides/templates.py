@@ -3,7 +3,9 @@
 # pyright: reportArgumentType=false, reportIndexIssue=false,  reportAttributeAccessIssue=false
 # mypy: disable-error-code="import-untyped"
 
+import io
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 import docx
@@ -26,7 +28,12 @@ def create_empty_slide_deck(cfg: UserConfig) -> presentation.Presentation:
     try:
         template_path = cfg.get_template_pptx_path()
         validated_template = file_io.validate_pptx_path(Path(template_path))
-        prs: presentation.Presentation = pptx.Presentation(str(validated_template))  # pyright: ignore[reportPrivateImportUsage]
+        template_stat = validated_template.stat()
+        template_bytes = _read_template_bytes(
+            str(validated_template), template_stat.st_mtime_ns, template_stat.st_size
+        )
+        # python-pptx edits the Presentation it loads, so every call gets its own buffer to parse from
+        prs: presentation.Presentation = pptx.Presentation(io.BytesIO(template_bytes))  # pyright: ignore[reportPrivateImportUsage]
     except Exception as e:
         log.error(f"Could not load template file at path {e}")
         raise ValueError(f"Could not load template file (may be corrupted): {e}")
@@ -52,6 +59,16 @@ def create_empty_slide_deck(cfg: UserConfig) -> presentation.Presentation:
     return prs
 
 
+@lru_cache(maxsize=4)
+def _read_template_bytes(template_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a template file from disk, reusing the bytes from earlier calls in this process.
+
+    mtime_ns and size are only part of the cache key, so that a template edited between runs gets re-read.
+    """
+    return Path(template_path).read_bytes()
+
+
 def delete_all_prs_slides(prs: presentation.Presentation) -> None:
     """Safely remove all slides from a Presentation object."""
     num_slides = len(prs.slides)
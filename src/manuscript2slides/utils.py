@@ -16,8 +16,11 @@ log = logging.getLogger("manuscript2slides")
 # region setup_console_encoding
 def setup_console_encoding() -> None:
     """Configure UTF-8 encoding for Windows console to prevent UnicodeEncodeError when printing non-ASCII characters (like emojis)."""
-    if platform.system() == "Windows":
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    # sys.platform is a constant string, unlike platform.system() which has to query the OS.
+    # reconfigure() switches the existing stream over in place, so calling this more than once is harmless
+    # (re-wrapping sys.stdout.buffer each time would stack wrappers around the same buffer).
+    if sys.platform == "win32" and isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(encoding="utf-8")
 
 
 # endregion
@@ -61,6 +64,17 @@ def str_to_bool(value: str) -> bool:
 # endregion
 
 
+# region preview_text
+def preview_text(text: str, max_chars: int = 20) -> str:
+    """Shorten text to its first max_chars characters for log previews, adding an ellipsis only if we cut something."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "..."
+
+
+# endregion
+
+
 # region open_folder_in_os_explorer
 def open_folder_in_os_explorer(folder_path: Path | str) -> None:
     """
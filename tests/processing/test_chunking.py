@@ -5,6 +5,7 @@ Is there an easy way to test that?
 """
 
 from pathlib import Path
+from typing import Callable
 
 import pytest
 from docx import Document
@@ -108,6 +109,25 @@ def test_chunk_by_heading_nested_successfully_nests(
     assert len(chunk_list) == 2
 
 
+@pytest.mark.parametrize(
+    "chunker",
+    [
+        chunking.chunk_by_page,
+        chunking.chunk_by_heading_nested,
+        chunking.chunk_by_heading_flat,
+    ],
+)
+def test_chunkers_skip_chunk_without_paragraphs(
+    chunker: Callable, path_to_empty_docx: Path
+) -> None:
+    """A document with only empty paragraphs should produce no chunks (and so no blank slide)."""
+    new_docx = Document(str(path_to_empty_docx))
+    new_docx.add_paragraph()
+    new_docx.add_paragraph()
+
+    assert chunker(new_docx) == []
+
+
 @pytest.mark.parametrize(
     "input_str,expected",
     [
@@ -147,3 +167,53 @@ def test_is_standard_heading(input_str: str, expected: bool) -> None:
 def test_get_heading_level(input_str: str, output_num: int | float) -> None:
     """Ensure we return the output number expected for standard headings, and infinity for those not supported."""
     assert chunking.get_heading_level(input_str) == output_num
+
+
+def test_is_empty_paragraph(path_to_empty_docx: Path) -> None:
+    """Blank paragraphs are empty; paragraphs with text or an intentional line break are not."""
+    new_docx = Document(str(path_to_empty_docx))
+
+    blank = new_docx.add_paragraph()
+    with_text = new_docx.add_paragraph("Some text")
+    with_newline = new_docx.add_paragraph()
+    with_newline.add_run().add_break()
+
+    assert chunking.is_empty_paragraph(blank) is True
+    assert chunking.is_empty_paragraph(with_text) is False
+    assert chunking.is_empty_paragraph(with_newline) is False
+
+
+def test_find_page_break_paragraphs_matches_contains_page_break(
+    path_to_sample_docx_with_everything: Path,
+) -> None:
+    """The one-pass page break lookup flags exactly the paragraphs python-docx reports as containing a page break."""
+    sample_document = Document(str(path_to_sample_docx_with_everything))
+
+    expected = {
+        para._p for para in sample_document.paragraphs if para.contains_page_break
+    }
+
+    assert expected, "Sample document should contain rendered page breaks."
+    assert chunking.find_page_break_paragraphs(sample_document) == expected
+
+
+def test_get_paragraph_style_name(
+    path_to_empty_docx: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Style names match python-docx's, including the Normal default, and are remembered per style."""
+    new_docx = Document(str(path_to_empty_docx))
+
+    heading = new_docx.add_paragraph("A heading", style="Heading 1")
+    unstyled = new_docx.add_paragraph("Body text")
+    second_heading = new_docx.add_paragraph("Another heading", style="Heading 1")
+
+    style_names: dict[str | None, str] = {}
+    assert chunking.get_paragraph_style_name(heading, style_names) == "Heading 1"
+    assert chunking.get_paragraph_style_name(unstyled, style_names) == "Normal"
+
+    # Once a style has been seen, looking it up again shouldn't go back through python-docx's para.style
+    def fail_style_lookup(_para: object) -> None:
+        raise AssertionError("para.style should not be read for an already-seen style")
+
+    monkeypatch.setattr(type(heading), "style", property(fail_style_lookup))
+    assert chunking.get_paragraph_style_name(second_heading, style_names) == "Heading 1"
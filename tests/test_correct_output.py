@@ -279,16 +279,15 @@ def test_vanilla_docx_theme_font_does_not_carry_into_pptx_output(
 def test_speaker_notes_empty_if_json_and_annotations_off(
     output_pptx_default_options: Path,
 ) -> None:
-    """Verify speaker notes are empty when all annotation and metadata display options are disabled."""
+    """Verify no speaker notes are created when all annotation and metadata display options are disabled."""
 
     prs = pptx.Presentation(output_pptx_default_options)
 
     slide, _para = helpers.find_first_slide_containing(
         prs, "In a cold concrete underground tunnel"
     )
-    notes_text_frame = helpers.get_slide_notes_text(slide)
 
-    assert notes_text_frame.text.strip() == ""
+    assert slide.has_notes_slide is False
 
 
 # endregion
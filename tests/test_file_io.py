@@ -10,6 +10,7 @@ from docx import Document, document
 from pptx import Presentation, presentation
 
 from manuscript2slides.file_io import (
+    _build_timestamped_output_filename,
     _validate_path,
     load_and_validate_docx,
     load_and_validate_pptx,
@@ -261,3 +262,16 @@ def test_load_pptx_rejects_pptx_with_no_slides_or_no_text(
 
 
 # endregion
+
+
+# region test _build_timestamped_output_filename
+def test_build_timestamped_output_filename_keeps_base_name_and_extension() -> None:
+    """Ensure the timestamp lands between the base filename and its extension."""
+    filename = _build_timestamped_output_filename(Document())
+
+    assert filename.startswith("pptx2docx-text_output_")
+    assert filename.endswith(".docx")
+    assert filename.count(".") == 1
+
+
+# endregion
@@ -31,6 +31,21 @@ def test_create_empty_slide_deck_returns_empty_deck(
     assert len(prs.slides) == 0, f"prs.slides has {len(prs.slides)} slides in it."
 
 
+def test_create_empty_slide_deck_returns_independent_decks(
+    path_to_sample_docx_with_formatting: Path,
+) -> None:
+    """Ensure that decks built from the cached template bytes don't share state between calls."""
+    test_cfg = UserConfig(input_docx=path_to_sample_docx_with_formatting)
+
+    first_prs = templates.create_empty_slide_deck(test_cfg)
+    first_prs.slides.add_slide(first_prs.slide_layouts[0])
+
+    second_prs = templates.create_empty_slide_deck(test_cfg)
+
+    assert len(first_prs.slides) == 1
+    assert len(second_prs.slides) == 0
+
+
 @pytest.fixture
 def path_to_missing_layout_pptx() -> Path:
     """Path to a pptx file that lacks the expected slide layout."""
@@ -4,7 +4,7 @@
 import pytest
 
 from manuscript2slides.internals import constants
-from manuscript2slides.utils import get_debug_mode, str_to_bool
+from manuscript2slides.utils import get_debug_mode, preview_text, str_to_bool
 
 
 # region basic pytest confidence check
@@ -134,3 +134,21 @@ def test_get_debug_mode_logs_warning_for_invalid_env_var(
 
 
 # endregion
+
+
+# region preview_text tests
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", ""),
+        ("short", "short"),
+        ("exactly twenty chars", "exactly twenty chars"),
+        ("this one is longer than twenty", "this one is longer t..."),
+    ],
+)
+def test_preview_text_truncates_only_long_text(text: str, expected: str) -> None:
+    """Ensure only text longer than the limit is cut and given an ellipsis."""
+    assert preview_text(text) == expected
+
+
+# endregion